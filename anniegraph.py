@@ -1,17 +1,77 @@
 import argparse
-from datetime import datetime, timedelta
+import copy
+from functools import lru_cache
+from itertools import cycle, islice
+import logging
+import os
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
-import plotly.graph_objects as go
-import yaml
 import webbrowser
 
+# matplotlib, plotly and yaml are imported where they are used, so each run
+# only pays the import cost of the output path and config handling it needs
+
+logger = logging.getLogger(__name__)
+
+# Rows read per chunk when streaming an input file through the Comet ID filter
+READ_CHUNK_SIZE = 1_000_000
+
+# Styles used when the configuration does not list any colors or shapes
+DEFAULT_COLORS = ["blue", "green", "red", "cyan", "magenta", "yellow", "black"]
+DEFAULT_SHAPES = ["o"]
+
+# Parsed YAML configurations keyed by (absolute path, modification time)
+_YAML_CACHE = {}
+
+def load_yaml_config(path):
+    """
+    Load a YAML configuration file, reusing the parsed result while the file is unchanged.
+
+    Each call returns its own copy, so changes to one configuration do not leak
+    into later loads of the same file.
+
+    Args:
+        path (str): Path to the YAML configuration file.
+
+    Returns:
+        dict: Parsed configuration.
+    """
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    if key not in _YAML_CACHE:
+        import yaml
+        try:
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+        with open(path, 'r') as file:
+            _YAML_CACHE[key] = yaml.load(file, Loader=YamlLoader)
+    return copy.deepcopy(_YAML_CACHE[key])
+
+@lru_cache(maxsize=128)
+def parse_column_names(column_names):
+    """
+    Parse column name mappings into (column name, display name) pairs.
+
+    Results are memoized, so they are returned as an immutable tuple; callers
+    build their own dictionary from it.
+
+    Args:
+        column_names (tuple): Column name mappings in the format "Display Name=Column Name".
+
+    Returns:
+        tuple: Pairs of column names and display names.
+    """
+    parsed = []
+    for item in column_names:
+        display_name, column_name = item.split("=")
+        parsed.append((column_name.strip(), display_name.strip()))
+    return tuple(parsed)
+
 class DataProcessor:
     """
     Handles loading and processing data from a CSV or tab-delimited file.
     """
-    def __init__(self, file_path, delimiter, comet_ids=None):
+    def __init__(self, file_path, delimiter, comet_ids=None, dtypes=None, columns=None):
         """
         Initialize the DataProcessor with a file path, delimiter, and optional comet IDs.
 
@@ -19,48 +79,129 @@ class DataProcessor:
             file_path (str): Path to the input file.
             delimiter (str): Delimiter used in the file (e.g., "," for CSV, "\t" for tab-delimited).
             comet_ids (list): List of comet IDs to filter the data.
+            dtypes (dict): Optional mapping of column names to dtypes, passed to the CSV parser.
+            columns (set): Optional set of column names to load; other columns are skipped.
         """
         self.file_path = file_path
         self.delimiter = delimiter
         self.comet_ids = comet_ids
+        self.dtypes = dtypes or {}
+        self.columns = columns
         self.data = self.load_data()
+        self._columns = frozenset(self.data.columns)
+        self._column_values = {}
+        self.get_uncertainties()
 
     def load_data(self):
         try:
-            data = pd.read_csv(self.file_path, delimiter=self.delimiter, engine='python')
-        
+            # Known column types spare the parser its type inference pass
+            read_options = dict(delimiter=self.delimiter, dtype={**self.dtypes, 'Comet ID': 'string'})
+            # Only the Python engine handles multi-character delimiters; naming it
+            # avoids pandas warning about the fallback on every read
+            header_options = dict(delimiter=self.delimiter)
+            if len(self.delimiter) > 1:
+                read_options['engine'] = header_options['engine'] = 'python'
+
+            # Only parse the referenced columns that are present in the header
+            if self.columns:
+                header = pd.read_csv(self.file_path, nrows=0, **header_options).columns
+                read_options['usecols'] = [col for col in header if col in self.columns]
+
+            try:
+                data = self.read_data(read_options)
+            except (ValueError, TypeError) as e:
+                if not self.dtypes:
+                    raise
+                # Declared types must parse without coercion (e.g. no padded "NaN" cells);
+                # fall back to inferred types so every read path behaves the same
+                logger.warning("Could not apply column types %s (%s); reading with inferred types", self.dtypes, e)
+                read_options['dtype'] = {'Comet ID': 'string'}
+                data = self.read_data(read_options)
+
             # Parse dates if they are in a specific column
             if 'dec. Date' in data.columns:
-                data['dec. Date'] = data['dec. Date'].apply(self.parse_custom_date)
+                data['dec. Date'] = self.parse_custom_dates(data['dec. Date'])
         
-            # Convert all non-date columns to numeric, setting errors to NaN
+            # Convert all non-date columns to numeric, setting errors to NaN.
+            # Padded "NaN" cells and placeholder symbols leave some columns as text;
+            # columns the parser already read as numbers are left untouched.
             numeric_cols = [col for col in data.columns if col not in ['dec. Date', 'Comet ID']]
-            data[numeric_cols] = data[numeric_cols].apply(pd.to_numeric, errors='coerce')
+            for col in numeric_cols:
+                if not pd.api.types.is_numeric_dtype(data[col]):
+                    data[col] = pd.to_numeric(data[col], errors='coerce')
         
-            # Replace NaN with 0 or interpolate missing values
-            data[numeric_cols] = data[numeric_cols].fillna(0)
-
-            # Debugging: Print the unique values in the "Comet ID" column
-            if 'Comet ID' in data.columns:
-                print("Unique Comet IDs in data:", data['Comet ID'].unique())
-            
-            if self.comet_ids:
-                print("Unique Comet IDs:", data['Comet ID'].unique())
-                print("Filtering with comet_ids:", self.comet_ids)
-                print("Comet ID dtype:", data['Comet ID'].dtype)
-                print("Comet ID type:", type(self.comet_ids[0]))
-                print("Filtering with comet_ids:", self.comet_ids)
-                data['Comet ID'] = data['Comet ID'].astype(str).str.strip()  # Strip whitespace
-                self.comet_ids = [str(comet_id).strip() for comet_id in self.comet_ids]
-                data = data[data['Comet ID'].isin(self.comet_ids)]
+            # Replace NaN with 0, only copying the columns that have missing values
+            nan_cols = [col for col in numeric_cols if data[col].hasnans]
+            if nan_cols:
+                data[nan_cols] = data[nan_cols].fillna(0)
+
+            # Debugging: Log the unique values in the loaded "Comet ID" column
+            if 'Comet ID' in data.columns and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unique Comet IDs in data: %s", data['Comet ID'].unique())
+                logger.debug("Comet ID dtype: %s", data['Comet ID'].dtype)
 
             if data.empty:
-                print("Warning: Filtered data is empty.")
+                logger.warning("Filtered data is empty.")
             return data
 
         except Exception as e:
           raise ValueError(f"Error loading data file: {e}")
 
+    def read_data(self, read_options):
+        """
+        Read the input file, keeping only the requested comets when a filter is set.
+
+        Args:
+            read_options (dict): Keyword arguments for pd.read_csv.
+
+        Returns:
+            pd.DataFrame: Loaded data.
+        """
+        if self.comet_ids:
+            logger.debug("Filtering with comet_ids: %s", self.comet_ids)
+            self.comet_ids = [str(comet_id).strip() for comet_id in self.comet_ids]
+            unique_comet_ids = list(set(self.comet_ids))
+
+            # Stream the file and keep only the requested comets from each chunk
+            chunks = []
+            reader = pd.read_csv(self.file_path, chunksize=READ_CHUNK_SIZE, **read_options)
+            for chunk in reader:
+                comet_id_values = np.char.strip(chunk['Comet ID'].to_numpy(dtype=str))  # Strip whitespace
+                mask = np.isin(comet_id_values, unique_comet_ids)
+                chunk = chunk.loc[mask].copy()
+                chunk['Comet ID'] = comet_id_values[mask]
+                chunks.append(chunk)
+            data = pd.concat(chunks, ignore_index=True)
+            # Categorical codes make the per-comet comparisons during plotting cheap
+            data['Comet ID'] = data['Comet ID'].astype('category')
+            return data
+
+        data = self.read_file(read_options)
+        if 'Comet ID' in data.columns:
+            # Strip the padding here too so the IDs match the filtered path
+            data['Comet ID'] = data['Comet ID'].str.strip().astype('category')
+        return data
+
+    def read_file(self, read_options):
+        """
+        Read the whole input file, preferring pandas' multithreaded pyarrow engine.
+
+        Falls back to the default parser when pyarrow is not installed or does not
+        support the options, such as multi-character delimiters.
+
+        Args:
+            read_options (dict): Keyword arguments for pd.read_csv.
+
+        Returns:
+            pd.DataFrame: Loaded data.
+        """
+        if len(self.delimiter) == 1:
+            try:
+                return pd.read_csv(self.file_path, engine='pyarrow', **read_options)
+            except (ImportError, ValueError):
+                logger.debug("pyarrow CSV engine unavailable, using the default parser")
+        return pd.read_csv(self.file_path, **read_options)
+
     def has_column(self, column_name):
         """
         Check if a column exists in the DataFrame.
@@ -71,41 +212,66 @@ class DataProcessor:
         Returns:
             bool: True if the column exists, False otherwise.
         """
-        return column_name in self.data.columns
-    
-    def parse_custom_date(self, date_float):
+        return column_name in self._columns
+
+    def column_values(self, column_name):
+        """
+        Get a column as a numpy array, converting it only on first access.
+
+        Args:
+            column_name (str): Name of the column.
+
+        Returns:
+            np.ndarray: Column values.
+        """
+        values = self._column_values.get(column_name)
+        if values is None:
+            values = self._column_values[column_name] = self.data[column_name].to_numpy()
+        return values
+
+    def parse_custom_dates(self, date_floats):
         """
-        Parse a custom date format from a float.
+        Parse a column of custom dates from floats.
 
         Args:
-            date_float (float): Date in the format YYYYMMDD.FFFF.
+            date_floats (pd.Series): Dates in the format YYYYMMDD.FFFF.
 
         Returns:
-            datetime: Parsed datetime object.
+            pd.Series: Parsed datetime values.
         """
         # Split integer and fractional parts
-        date_int = int(date_float)
-        frac = date_float - date_int
-        
+        values = date_floats.to_numpy(dtype=np.float64)
+        date_ints = values.astype(np.int64)
+        frac = values - date_ints
+
         # Parse the date part
-        date_str = str(date_int)
-        date = datetime.strptime(date_str, "%Y%m%d")
-        
-        # Calculate the time part
-        time = timedelta(seconds=frac * 86400)
-        
-        # Combine date and time
-        return date + time
+        dates = pd.to_datetime(date_ints.astype(str), format="%Y%m%d")
+
+        # Add the time part
+        times = pd.to_timedelta(frac * 86400.0, unit="s")
+        return pd.Series(dates + times, index=date_floats.index)
 
     def get_uncertainties(self):
         """
         Identify uncertainty columns ending with 'sigup' and 'sigdown'.
 
+        Also stores complete pairs in `uncertainty_pairs`, mapping each base
+        column name to its (sigup, sigdn) column names.
+
         Returns:
             tuple: Two lists containing columns for 'sigup' and 'sigdn'.
         """
-        sigup_columns = [col for col in self.data.columns if col.endswith("sigup")]
-        sigdown_columns = [col for col in self.data.columns if col.endswith("sigdn")]
+        sigup_columns = []
+        sigdown_columns = []
+        pairs = {}
+        for col in self.data.columns:
+            if col.endswith("sigup"):
+                sigup_columns.append(col)
+                pairs.setdefault(col[:-5], [None, None])[0] = col
+            elif col.endswith("sigdn"):
+                sigdown_columns.append(col)
+                pairs.setdefault(col[:-5], [None, None])[1] = col
+        self.uncertainty_pairs = {base: tuple(cols) for base, cols in pairs.items() if None not in cols}
         return sigup_columns, sigdown_columns
 
 class GraphConfig:
@@ -121,10 +287,9 @@ class GraphConfig:
             import_config (str): Path to a YAML configuration file.
         """
         if import_config:
-            with open(import_config, 'r') as file:
-                config = yaml.safe_load(file)
+            config = load_yaml_config(import_config)
             self.x_axis = config.get("x_axis")
-            self.y_axes = config.get("y_axes", [])
+            self.y_axes = [y_axis.strip() for y_axis in config.get("y_axes", [])]
             self.x_min = config.get("x_min")
             self.x_max = config.get("x_max")
             self.y_min = config.get("y_min")
@@ -133,63 +298,98 @@ class GraphConfig:
             self.shapes = config.get("shapes", [])
             self.legend = config.get("legend", False)
             self.dpi = config.get("dpi", 300)
+            self.fig_width = config.get("fig_width")
+            self.fig_height = config.get("fig_height")
             self.font_size = config.get("font_size", 12)
             self.output_file = config.get("output_file", "output_graph.html")
             self.output_format = config.get("output_format", "png")
             self.interactive = config.get("interactive", False)
             self.use_uncertainties = config.get("use_uncertainties", False)
             self.delimiter = config.get("delimiter", ",")
-            self.column_names = self.parse_column_names(config.get("column_names", []))
+            self.column_names = dict(parse_column_names(tuple(config.get("column_names", []))))
+            self.dtypes = self.parse_dtypes(config.get("dtypes", []))
             self.x_axis_title = config.get("x_axis_title", self.x_axis)
             self.y_axis_title = config.get("y_axis_title", " / ".join(self.y_axes))
             self.style = config.get("style", "classic")
+            self.plotlyjs = config.get("plotlyjs", "cdn")
             self.x_ticks = config.get("x_ticks", None)
             self.y_ticks = config.get("y_ticks", None)
             self.comet_ids = config.get("comet_ids", None)
             self.validate_config()
         elif args:
             self.x_axis = args.x_axis
-            self.y_axes = args.y_axes.split(",") if args.y_axes else []
+            self.y_axes = [y_axis.strip() for y_axis in args.y_axes or []]
             self.x_min = args.x_min
             self.x_max = args.x_max
             self.y_min = args.y_min
             self.y_max = args.y_max
             self.comet_ids = args.comet_id.split(",") if args.comet_id else None
-            self.colors = args.colors.split(",") if args.colors else []
-            self.shapes = args.shapes.split(",") if args.shapes else []
+            self.colors = args.colors or []
+            self.shapes = args.shapes or []
             self.legend = args.legend
             self.dpi = args.dpi
+            self.fig_width = args.fig_width
+            self.fig_height = args.fig_height
             self.font_size = args.font_size
             self.output_file = args.output_file if args.output_file else "output_graph.html"
             self.output_format = args.output_format
             self.interactive = args.interactive
             self.use_uncertainties = args.use_uncertainties
             self.delimiter = args.delimiter
-            self.column_names = self.parse_column_names(args.column_names) if args.column_names else {}
+            self.column_names = dict(parse_column_names(tuple(args.column_names))) if args.column_names else {}
+            self.dtypes = self.parse_dtypes(args.dtypes) if args.dtypes else {}
             self.x_axis_title = args.x_axis_title if args.x_axis_title else self.x_axis
             self.y_axis_title = args.y_axis_title if args.y_axis_title else " / ".join(self.y_axes)
             self.style = args.style if args.style else "petroff10"
+            self.plotlyjs = args.plotlyjs
             self.x_ticks = args.x_ticks
             self.y_ticks = args.y_ticks
 
+        # Evenly spaced x-axis ticks shared by both render paths
+        self.x_tickvals = None
+        if self.x_ticks and self.x_min is not None and self.x_max is not None:
+            self.x_tickvals = np.linspace(self.x_min, self.x_max, self.x_ticks + 1)
+
         if not self.output_file:
             raise ValueError("Output file must be specified either in the command-line arguments or in the configuration file.")
 
-    def parse_column_names(self, column_names_list):
+    def required_columns(self):
+        """
+        Collect the input file columns referenced by this configuration.
+
+        Names are given as they appear in the file, before column_names is applied.
+        Axes given by their display name also pull in the file column they map to.
+
+        Returns:
+            set: Column names needed to render the graph.
+        """
+        file_names = {display: original for original, display in self.column_names.items()}
+        columns = {"Comet ID", "delta T", self.x_axis, file_names.get(self.x_axis, self.x_axis)}
+        for y_axis in self.y_axes:
+            columns.update((y_axis, file_names.get(y_axis, y_axis)))
+            if self.use_uncertainties:
+                # Uncertainty columns are looked up by the y-axis display name
+                # and may themselves be display names for other file columns
+                for name in (y_axis, self.column_names.get(y_axis, y_axis)):
+                    for sigma in (f"{name}sigup", f"{name}sigdn"):
+                        columns.update((sigma, file_names.get(sigma, sigma)))
+        return columns
+
+    def parse_dtypes(self, dtypes_list):
         """
-        Parse the column names list into a dictionary.
+        Parse the column dtypes list into a dictionary.
 
         Args:
-            column_names_list (list): List of column name mappings in the format "Display Name=Column Name".
+            dtypes_list (list): List of column dtypes in the format "Column Name=dtype".
 
         Returns:
-            dict: Dictionary of column name mappings.
+            dict: Dictionary mapping column names to dtypes.
         """
-        column_names = {}
-        for item in column_names_list:
-            display_name, column_name = item.split("=")
-            column_names[column_name.strip()] = display_name.strip()
-        return column_names
+        dtypes = {}
+        for item in dtypes_list:
+            column_name, dtype = item.rsplit("=", 1)
+            dtypes[column_name.strip()] = dtype.strip()
+        return dtypes
 
     def validate_config(self):
         """
@@ -207,6 +407,12 @@ class GraphConfig:
         Args:
             output_path (str): Path to save the YAML configuration file.
         """
+        import yaml
+        try:
+            from yaml import CSafeDumper as YamlDumper
+        except ImportError:
+            from yaml import SafeDumper as YamlDumper
+
         config_dict = {
             "x_axis": self.x_axis,
             "y_axes": self.y_axes,
@@ -219,6 +425,8 @@ class GraphConfig:
             "shapes": self.shapes,
             "legend": self.legend,
             "dpi": self.dpi,
+            "fig_width": self.fig_width,
+            "fig_height": self.fig_height,
             "font_size": self.font_size,
             "output_file": self.output_file,
             "output_format": self.output_format,
@@ -226,14 +434,16 @@ class GraphConfig:
             "use_uncertainties": self.use_uncertainties,
             "delimiter": self.delimiter,
             "column_names": [f"{v}={k}" for k, v in self.column_names.items()],
+            "dtypes": [f"{k}={v}" for k, v in self.dtypes.items()],
             "x_axis_title": self.x_axis_title,
             "y_axis_title": self.y_axis_title,
             "style": self.style,
+            "plotlyjs": self.plotlyjs,
             "x_ticks": self.x_ticks,
             "y_ticks": self.y_ticks
         }
         with open(output_path, 'w') as file:
-            yaml.safe_dump(config_dict, file)
+            yaml.dump(config_dict, file, Dumper=YamlDumper)
 
 class Graph:
     """
@@ -249,23 +459,55 @@ class Graph:
         """
         self.config = config
         self.data_processor = data_processor
-        self.rename_columns()
-        self.update_y_axes()
-
-    def rename_columns(self):
+        # Display names are resolved to the file's columns through a lookup table
+        # rather than by renaming the DataFrame
+        self._col_alias = {display: original for original, display in self.config.column_names.items()}
+        logger.debug("Column aliases: %s", self._col_alias)
+
+        # Resolve per-series names, styles and arrays once for both render paths
+        self._y_axes = list(self.config.y_axes)
+        self._labels = [self.config.column_names.get(y_axis, y_axis) for y_axis in self._y_axes]
+        self._color_cycle = self.config.colors or DEFAULT_COLORS
+        self._shape_cycle = self.config.shapes or DEFAULT_SHAPES
+        self._colors = list(islice(cycle(self._color_cycle), len(self._y_axes)))
+        self._shapes = list(islice(cycle(self._shape_cycle), len(self._y_axes)))
+        self._x = self.col(self.config.x_axis)
+        self._ys = [self.col(y_axis) for y_axis in self._y_axes]
+
+    def col(self, name):
         """
-        Rename columns in the data according to the provided column mapping.
+        Get the values of a column by its original or display name.
+
+        A name that is a column in the file takes precedence over a display name.
+
+        Args:
+            name (str): Column name as it appears in the file or in column_names.
+
+        Returns:
+            np.ndarray: Values of the column.
         """
-        print("Original columns:", self.data_processor.data.columns)  # Debugging statement
-        self.data_processor.data.rename(columns=self.config.column_names, inplace=True)
-        print("Renamed columns:", self.data_processor.data.columns)  # Debugging statement
+        if not self.data_processor.has_column(name):
+            name = self._col_alias.get(name, name)
+        return self.data_processor.column_values(name)
 
-    def update_y_axes(self):
+    def _uncertainty_pair(self, label):
         """
-        Update y_axes to use the renamed columns.
+        Find the sigup and sigdn columns for a y-axis display name.
+
+        Sigma columns may be named in the file or renamed through column_names.
+
+        Args:
+            label (str): Display name of the y-axis.
+
+        Returns:
+            tuple: File names of the (sigup, sigdn) columns, or None if either is missing.
         """
-        self.config.y_axes = [self.config.column_names.get(y_axis, y_axis) for y_axis in self.config.y_axes]
-        print("Updated y-axes:", self.config.y_axes)  # Debugging statement
+        pair = self.data_processor.uncertainty_pairs.get(label)
+        if pair is None and self._col_alias:
+            pair = tuple(self._col_alias.get(f"{label}{suffix}") for suffix in ("sigup", "sigdn"))
+            if not all(self.data_processor.has_column(column) for column in pair):
+                return None
+        return pair
 
     def render(self):
         """
@@ -280,6 +522,12 @@ class Graph:
         """
         Render a static graph using matplotlib.
         """
+        import matplotlib
+        # Output only goes to a file, so skip GUI backend selection and the display it needs
+        matplotlib.use("Agg", force=True)
+        import matplotlib.pyplot as plt
+        from matplotlib.lines import Line2D
+
         # Set a style and configure the font
         plt.style.use(self.config.style)
         plt.rcParams.update({
@@ -290,70 +538,101 @@ class Graph:
             "xtick.labelsize": self.config.font_size,
             "ytick.labelsize": self.config.font_size,
             "axes.facecolor": "white",
-            "figure.facecolor": "white"
+            "figure.facecolor": "white",
+            # Save at the figure's set size even if the style asks for a tight bounding box
+            "savefig.bbox": "standard"
         })
 
-        plt.figure(dpi=self.config.dpi)
-
-        x = self.data_processor.data[self.config.x_axis]
-
-        for i, y_axis in enumerate(self.config.y_axes):
-            y_axis = y_axis.strip()  # Ensure no leading/trailing spaces
-            print(f"Processing y-axis: {y_axis}")  # Debugging statement
-            y = self.data_processor.data[y_axis]
+        # Any dimension that is not set comes from the style's default figure size
+        default_width, default_height = plt.rcParams["figure.figsize"]
+        figsize = (self.config.fig_width or default_width, self.config.fig_height or default_height)
+        plt.figure(figsize=figsize, dpi=self.config.dpi)
 
-            # Remove masked or missing values
-            mask = ~y.isna()
-            x_filtered = x[mask]
-            y_filtered = y[mask]
+        x = self._x
 
-            # Filter out zero values
-            mask = (y_filtered != 0) & (~y_filtered.isna())
-            x_filtered = x_filtered[mask]
-            y_filtered = y_filtered[mask]
-
-            delta_t_exists = self.data_processor.has_column("delta T")
-
-            for j, comet_id in enumerate(self.data_processor.comet_ids):
-                comet_mask = self.data_processor.data['Comet ID'] == comet_id
-                x_comet = x_filtered[comet_mask]
-                y_comet = y_filtered[comet_mask]
-                color = self.config.colors[j % len(self.config.colors)]
-                shape = self.config.shapes[j % len(self.config.shapes)]
+        # Group row positions by comet and convert delta T once for all y-axes;
+        # without a comet filter every comet in the data is plotted, and files
+        # without a Comet ID column are plotted as a single unlabelled group
+        if self.data_processor.has_column('Comet ID'):
+            comet_rows = self.data_processor.data.groupby('Comet ID', observed=True, sort=False).indices
+        else:
+            comet_rows = {None: np.arange(len(self.data_processor.data))}
+        comet_ids = self.data_processor.comet_ids or list(comet_rows)
+        no_rows = np.array([], dtype=np.intp)
+        delta_t_exists = self.data_processor.has_column("delta T")
+        delta_t_values = self.data_processor.column_values("delta T") if delta_t_exists else None
+
+        # Resolve each comet's color and shape once
+        comet_count = len(comet_ids)
+        comet_colors = list(islice(cycle(self._color_cycle), comet_count))
+        comet_shapes = list(islice(cycle(self._shape_cycle), comet_count))
+
+        # Points from every y-axis and comet are collected first and drawn with one
+        # scatter call per filled marker shape plus one for all open circles
+        filled_points = {}
+        open_x, open_y, open_colors = [], [], []
+
+        for i, y_axis in enumerate(self._y_axes):
+            logger.debug("Processing y-axis: %s", y_axis)
+            y = self._ys[i]
+
+            # Remove masked, missing, infinite or zero values in one pass
+            mask = np.isfinite(y) & (y != 0)
+
+            # Convert the uncertainty columns once per y-axis
+            sigup_values = sigdown_values = None
+            uncertainty_pair = self._uncertainty_pair(self._labels[i])
+            if self.config.use_uncertainties and uncertainty_pair:
+                sigup_column, sigdown_column = uncertainty_pair
+                sigup_values = self.data_processor.column_values(sigup_column).astype(np.float64, copy=False)
+                sigdown_values = self.data_processor.column_values(sigdown_column).astype(np.float64, copy=False)
+
+            for j, comet_id in enumerate(comet_ids):
+                rows = comet_rows.get(comet_id, no_rows)
+                rows = rows[mask[rows]]
+                x_comet = x[rows]
+                y_comet = y[rows]
+                color = comet_colors[j]
+                shape = comet_shapes[j]
 
                 # Plot uncertainties
-                if self.config.use_uncertainties:
-                    sigup_column = f"{y_axis}sigup"
-                    sigdown_column = f"{y_axis}sigdn"
-                    if self.data_processor.has_column(sigup_column) and self.data_processor.has_column(sigdown_column):
-                        yerr = [
-                            self.data_processor.data[sigdown_column][comet_mask].astype(float),
-                            self.data_processor.data[sigup_column][comet_mask].astype(float)
-                        ]
-                        plt.errorbar(x_comet, y_comet, yerr=yerr, fmt="none", ecolor=color)
-
-                # Plot data points
+                if sigup_values is not None:
+                    yerr = np.vstack((sigdown_values[rows], sigup_values[rows]))
+                    plt.errorbar(x_comet, y_comet, yerr=yerr, fmt="none", ecolor=color)
+
+                # Collect data points: filled markers for delta T >= 0, open circles otherwise
                 if delta_t_exists:
-                    delta_t = self.data_processor.data["delta T"]
-                    for idx in range(len(x_comet)):
-                        value = delta_t[comet_mask].iloc[idx]
-                        shape = shape if value >= 0 else "o"
-                        plt.scatter(
-                            x_comet.iloc[idx], y_comet.iloc[idx],
-                            c=color if value >= 0 else "none",
-                            edgecolors=color if value < 0 else None,
-                            marker=shape,
-                            label=comet_id if idx == 0 else ""
-                        )
+                    pos = delta_t_values[rows] >= 0
                 else:
-                    plt.scatter(x_comet, y_comet, c=color, marker=shape, label=comet_id)
+                    pos = np.ones(len(x_comet), dtype=bool)
+                points = filled_points.setdefault(shape, ([], [], []))
+                points[0].append(x_comet[pos])
+                points[1].append(y_comet[pos])
+                points[2].extend([color] * int(pos.sum()))
+                open_x.append(x_comet[~pos])
+                open_y.append(y_comet[~pos])
+                open_colors.extend([color] * int((~pos).sum()))
+
+        # Plot data points
+        for shape, (xs, ys, colors) in filled_points.items():
+            if colors:
+                plt.scatter(np.concatenate(xs), np.concatenate(ys), c=colors, marker=shape)
+        if open_colors:
+            plt.scatter(np.concatenate(open_x), np.concatenate(open_y), facecolors="none", edgecolors=open_colors, marker="o")
 
         plt.xlabel(self.config.x_axis_title)
         plt.ylabel(self.config.y_axis_title)
         if self.config.legend:
-            plt.legend()
-        if self.config.x_ticks:
-            plt.xticks(ticks=range(int(self.config.x_min), int(self.config.x_max) + 1, int((self.config.x_max - self.config.x_min) / self.config.x_ticks)))
+            # Points are batched across comets, so label each comet with a proxy artist
+            handles = [
+                Line2D([], [], marker=comet_shapes[j], color=comet_colors[j], linestyle="", label=comet_id)
+                for j, comet_id in enumerate(comet_ids)
+                if comet_id is not None
+            ]
+            if handles:
+                plt.legend(handles=handles)
+        if self.config.x_tickvals is not None:
+            plt.xticks(ticks=self.config.x_tickvals)
         if self.config.y_ticks:
             y_step = (self.config.y_max - self.config.y_min) / self.config.y_ticks
             if abs(y_step) < 1e-6:
@@ -362,14 +641,20 @@ class Graph:
                 y_step = -y_step
             y_step = round(y_step, 6)
             plt.yticks(ticks=np.arange(self.config.y_min, self.config.y_max + y_step, y_step))
-        plt.savefig(self.config.output_file, format=self.config.output_format)
+        # Trade PNG file size for a much cheaper zlib pass
+        save_options = {}
+        if self.config.output_format == "png":
+            save_options["pil_kwargs"] = {"optimize": False, "compress_level": 1}
+        plt.savefig(self.config.output_file, format=self.config.output_format, **save_options)
         plt.close()
 
     def _render_interactive(self):
         """
         Render an interactive graph using Plotly.
         """
-        x = self.data_processor.data[self.config.x_axis]
+        import plotly.graph_objects as go
+
+        x = self._x
 
         # Mapping Matplotlib markers to Plotly symbols
         marker_mapping = {
@@ -385,97 +670,141 @@ class Graph:
             "x": "x"
         }
 
-        fig = go.Figure()
+        # Traces are collected and handed to the Figure constructor in one go, so
+        # the figure is validated once rather than on every add_trace call
+        traces = []
         delta_t_exists = self.data_processor.has_column("delta T")
+        delta_t_values = self.data_processor.column_values("delta T") if delta_t_exists else None
+        x_valid = pd.notna(x)
 
-        for i, y_axis in enumerate(self.config.y_axes):
-            y_axis = y_axis.strip()  # Ensure no leading/trailing spaces
-            y = self.data_processor.data[y_axis]
+        symbols = [marker_mapping.get(shape, "circle") for shape in self._shapes]
 
-            # Handle missing or invalid values
-            x = x.dropna()
-            y = y.dropna()
+        for i, y_axis in enumerate(self._y_axes):
+            y = self._ys[i]
+
+            # Handle missing or invalid values, keeping x and y aligned
+            keep = x_valid & np.isfinite(y)
+            x_values = x[keep]
+            y_values = y[keep]
+
+            # Uncertainties are drawn as asymmetric error bars on the marker traces
+            sigup_values = sigdown_values = None
+            uncertainty_pair = self._uncertainty_pair(self._labels[i])
+            if self.config.use_uncertainties and uncertainty_pair:
+                sigup_column, sigdown_column = uncertainty_pair
+                sigup_values = self.data_processor.column_values(sigup_column)[keep]
+                sigdown_values = self.data_processor.column_values(sigdown_column)[keep]
 
             if delta_t_exists:
-                delta_t = self.data_processor.data["delta T"]
-                for idx, value in delta_t.items():
-                    shape = marker_mapping.get(self.config.shapes[0], "circle") if value >= 0 else marker_mapping.get(self.config.shapes[1], "circle-open")
-                    color = self.config.colors[i % len(self.config.colors)]
-                    fig.add_trace(
-                        go.Scatter(
-                            x=[x[idx]],
-                            y=[y[idx]],
-                            mode="markers",
-                            marker=dict(symbol=shape, color=color),
-                            name=self.config.column_names.get(y_axis, y_axis) if idx == 0 else ""  # Use original column name for label
-                        )
-                    )
-            else:
-                shape = marker_mapping.get(self.config.shapes[i % len(self.config.shapes)], "circle")
-                fig.add_trace(
+                pos = delta_t_values[keep] >= 0
+                shape = symbols[0]
+                color = self._colors[i]
+                # One trace for delta T >= 0 and, if needed, one open-marker trace for the rest
+                traces.append(
                     go.Scatter(
-                        x=x,
-                        y=y,
+                        x=x_values[pos],
+                        y=y_values[pos],
                         mode="markers",
-                        marker=dict(symbol=shape, color=self.config.colors[i % len(self.config.colors)]),
-                        name=self.config.column_names.get(y_axis, y_axis)
+                        marker=dict(symbol=shape, color=color),
+                        error_y=self._error_y(sigup_values, sigdown_values, pos),
+                        name=self._labels[i]
                     )
                 )
-
-            if self.config.use_uncertainties:
-                sigup_column = f"{y_axis}sigup"
-                sigdown_column = f"{y_axis}sigdn"
-                if self.data_processor.has_column(sigup_column) and self.data_processor.has_column(sigdown_column):
-                    fig.add_trace(
+                if not pos.all():
+                    traces.append(
                         go.Scatter(
-                            x=x,
-                            y=y + self.data_processor.data[sigup_column],
-                            mode="lines",
-                            line=dict(color=self.config.colors[i % len(self.config.colors)], dash="dash"),
+                            x=x_values[~pos],
+                            y=y_values[~pos],
+                            mode="markers",
+                            marker=dict(symbol="circle-open", color=color),
+                            error_y=self._error_y(sigup_values, sigdown_values, ~pos),
                             showlegend=False
                         )
                     )
-                    fig.add_trace(
-                        go.Scatter(
-                            x=x,
-                            y=y - self.data_processor.data[sigdown_column],
-                            mode="lines",
-                            line=dict(color=self.config.colors[i % len(self.config.colors)], dash="dash"),
-                            showlegend=False
-                        )
+            else:
+                traces.append(
+                    go.Scatter(
+                        x=x_values,
+                        y=y_values,
+                        mode="markers",
+                        marker=dict(symbol=symbols[i], color=self._colors[i]),
+                        error_y=self._error_y(sigup_values, sigdown_values),
+                        name=self._labels[i]
                     )
+                )
 
-        fig.update_layout(
+        xaxis = dict(title=self.config.x_axis_title)
+        if self.config.x_tickvals is not None:
+            xaxis["tickvals"] = self.config.x_tickvals
+        layout = go.Layout(
             title="Astronomy Data Graph",
-            xaxis_title=self.config.x_axis_title,
-            yaxis_title=self.config.y_axis_title,
+            xaxis=xaxis,
+            yaxis=dict(title=self.config.y_axis_title),
             legend=dict(visible=self.config.legend),
         )
-        if self.config.x_ticks:
-            fig.update_xaxes(tickvals=range(int(self.config.x_min), int(self.config.x_max) + 1, int((self.config.x_max - self.config.x_min) / self.config.x_ticks)))
-        fig.write_html(self.config.output_file)
+        fig = go.Figure(data=traces, layout=layout)
+
+        # Reference plotly.js rather than inlining ~3.5 MB into every file, unless asked to;
+        # "directory" writes one shared plotly.min.js next to the output for offline use
+        include_plotlyjs = True if self.config.plotlyjs == "inline" else self.config.plotlyjs
+        fig.write_html(
+            self.config.output_file,
+            include_plotlyjs=include_plotlyjs,
+            full_html=True,
+            config={"responsive": True}
+        )
         webbrowser.open(self.config.output_file)
 
+    def _error_y(self, sigup_values, sigdown_values, selection=slice(None)):
+        """
+        Build Plotly error bar settings for the selected points of a trace.
+
+        Args:
+            sigup_values (np.ndarray): Upper uncertainties, or None.
+            sigdown_values (np.ndarray): Lower uncertainties, or None.
+            selection (np.ndarray): Boolean mask selecting the trace's points.
+
+        Returns:
+            dict: Plotly error_y settings, or None when there are no uncertainties.
+        """
+        if sigup_values is None:
+            return None
+        return dict(
+            type="data",
+            symmetric=False,
+            array=sigup_values[selection],
+            arrayminus=sigdown_values[selection],
+            visible=True
+        )
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Little Orphan Annie's AstroGraph")
     parser.add_argument("--file", required=False, help="Path to the input file")
     parser.add_argument("--delimiter", default="\t", help="Delimiter used in the file (default: '\t')")
     parser.add_argument("--x-axis", required=False, help="Column to use for the x-axis")
-    parser.add_argument("--y-axes", required=False, help="Comma-separated list of columns to use for the y-axis")
+    parser.add_argument("--y-axes", nargs="+", required=False, help="Columns to use for the y-axis")
     parser.add_argument("--x-min", type=float, help="Minimum value for the x-axis")
     parser.add_argument("--x-max", type=float, help="Maximum value for the x-axis")
     parser.add_argument("--y-min", type=float, help="Minimum value for the y-axis")
     parser.add_argument("--y-max", type=float, help="Maximum value for the y-axis")
-    parser.add_argument("--colors", help="Comma-separated list of colors for the graph")
-    parser.add_argument("--shapes", help="Comma-separated list of shapes for the graph")
+    parser.add_argument("--colors", nargs="+", help="Colors for the graph")
+    parser.add_argument("--shapes", nargs="+", help="Shapes for the graph")
     parser.add_argument("--legend", action="store_true", help="Include a legend in the graph")
     parser.add_argument("--dpi", type=int, default=300, help="DPI for the output graph")
+    parser.add_argument("--fig-width", type=float, help="Width of the static graph in inches")
+    parser.add_argument("--fig-height", type=float, help="Height of the static graph in inches")
     parser.add_argument("--font-size", type=int, default=12, help="Font size for labels and legends")
     parser.add_argument("--output-file", required=False, help="Path to save the output graph")
     parser.add_argument("--output-format", default="png", help="Output file format (default: 'png')")
     parser.add_argument("--interactive", action="store_true", help="Generate an interactive graph")
     parser.add_argument("--use-uncertainties", action="store_true", help="Include uncertainties in the graph")
     parser.add_argument("--style", default="classic", help="Style for the graph (default: 'petroff10')")
+    parser.add_argument(
+        "--plotlyjs",
+        choices=["cdn", "directory", "inline"],
+        default="cdn",
+        help="How interactive graphs load plotly.js: from a CDN, a shared plotly.min.js next to the file, or inlined (default: 'cdn')"
+    )
     parser.add_argument("--x-ticks", type=int, help="Number of tick marks on the x-axis")
     parser.add_argument("--y-ticks", type=int, help="Number of tick marks on the y-axis")
     parser.add_argument(
@@ -483,14 +812,24 @@ if __name__ == "__main__":
         nargs="+",
         help="Pairs of original and new column names (e.g., OriginalName=NewName)"
     )
+    parser.add_argument(
+        "--dtypes",
+        nargs="+",
+        help="Column types for the CSV parser (e.g., \"log r=float64\")"
+    )
     parser.add_argument("--import-config", help="Path to a YAML configuration file")
     parser.add_argument("--export-config", help="Path to save the configuration as a YAML file")
     parser.add_argument("--x-axis-title", help="Title for the x-axis")
     parser.add_argument("--y-axis-title", help="Title for the y-axis")
     parser.add_argument("--comet-id", help="Comma-separated list of comet IDs to filter the data")
+    parser.add_argument("--verbose", action="store_true", help="Print debugging output")
 
     args = parser.parse_args()
 
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     if args.import_config:
         config = GraphConfig(import_config=args.import_config)
     else:
@@ -503,11 +842,11 @@ if __name__ == "__main__":
         raise ValueError("Input file must be specified when not exporting configuration.")
     
     comet_ids = args.comet_id.split(",") if args.comet_id else None
-    data_processor = DataProcessor(args.file, config.delimiter, comet_ids)
+    data_processor = DataProcessor(args.file, config.delimiter, comet_ids, config.dtypes, config.required_columns())
     
-    # Debugging: Print column names
-    print("Data columns:", data_processor.data.columns)
-    print("Configured y-axes:", config.y_axes)
+    # Debugging: Log column names
+    logger.debug("Data columns: %s", list(data_processor.data.columns))
+    logger.debug("Configured y-axes: %s", config.y_axes)
     
     graph = Graph(config, data_processor)
     graph.render()
\ No newline at end of file